@@ -0,0 +1,133 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from app import app, activities
+
+
+# Initial state of the in-memory activity database
+_ORIGINAL_ACTIVITIES = {
+    "Basketball Team": {
+        "description": "Join the school basketball team for training and competitions",
+        "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
+        "max_participants": 15,
+        "participants": []
+    },
+    "Soccer Club": {
+        "description": "Participate in soccer practice and matches",
+        "schedule": "Wednesdays, 3:30 PM - 5:30 PM",
+        "max_participants": 18,
+        "participants": []
+    },
+    "Drama Club": {
+        "description": "Explore acting, stagecraft, and participate in school plays",
+        "schedule": "Mondays, 4:00 PM - 5:30 PM",
+        "max_participants": 25,
+        "participants": []
+    },
+    "Art Workshop": {
+        "description": "Develop your artistic skills in painting, drawing, and sculpture",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 20,
+        "participants": []
+    },
+    "Math Olympiad": {
+        "description": "Prepare for and compete in mathematics competitions",
+        "schedule": "Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 10,
+        "participants": []
+    },
+    "Science Club": {
+        "description": "Conduct experiments and explore scientific concepts",
+        "schedule": "Wednesdays, 4:00 PM - 5:00 PM",
+        "max_participants": 15,
+        "participants": []
+    },
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+    }
+}
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Create an async client for the FastAPI app, shared across the session"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+# Whether activities may differ from the initial state. seed_activities_json
+# restores activities and clears this flag when it is first set up; that is
+# only safe because pytest sets up session fixtures before the function-scoped
+# autouse reset_activities, so no test is mid-run when it happens.
+_activities_dirty = True
+
+
+def _fresh_activities():
+    """Build a copy of the initial state with new participant lists"""
+    # Only the participant lists are mutated; every other value is immutable
+    return {
+        name: {**meta, "participants": list(meta["participants"])}
+        for name, meta in _ORIGINAL_ACTIVITIES.items()
+    }
+
+
+def _restore_activities():
+    """Restore the in-memory activity database to its initial state"""
+    global _activities_dirty
+    activities.clear()
+    activities.update(_fresh_activities())
+    _activities_dirty = False
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(request):
+    """Reset activities to initial state before each test"""
+    global _activities_dirty
+    if _activities_dirty:
+        _restore_activities()
+    # Tests marked readonly promise not to mutate activities
+    readonly = request.node.get_closest_marker("readonly") is not None
+    if not readonly:
+        _activities_dirty = True
+    yield
+    # Guard the readonly promise so later tests never see dirty state
+    if readonly and activities != _ORIGINAL_ACTIVITIES:
+        _activities_dirty = True
+        pytest.fail(f"{request.node.nodeid} is marked readonly but mutated activities")
+
+
+@pytest.fixture
+def seed_activities():
+    """Return a copy of the initial state of the activity database"""
+    # Never hand out _ORIGINAL_ACTIVITIES itself; every reset is rebuilt from it
+    return _fresh_activities()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def seed_activities_json(client):
+    """Cache the GET /activities JSON for the initial state"""
+    # An earlier test may have left activities dirty; restoring here also
+    # clears _activities_dirty, which is still accurate since the state is clean
+    _restore_activities()
+    response = await client.get("/activities")
+    return response.json()
@@ -2,120 +2,50 @@
 Tests for the Mergington High School Activities API
 """
 
+from urllib.parse import quote
+
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
-
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from app import app, activities
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original state
-    original_activities = {
-        "Basketball Team": {
-            "description": "Join the school basketball team for training and competitions",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 15,
-            "participants": []
-        },
-        "Soccer Club": {
-            "description": "Participate in soccer practice and matches",
-            "schedule": "Wednesdays, 3:30 PM - 5:30 PM",
-            "max_participants": 18,
-            "participants": []
-        },
-        "Drama Club": {
-            "description": "Explore acting, stagecraft, and participate in school plays",
-            "schedule": "Mondays, 4:00 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": []
-        },
-        "Art Workshop": {
-            "description": "Develop your artistic skills in painting, drawing, and sculpture",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": []
-        },
-        "Math Olympiad": {
-            "description": "Prepare for and compete in mathematics competitions",
-            "schedule": "Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 10,
-            "participants": []
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore scientific concepts",
-            "schedule": "Wednesdays, 4:00 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": []
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
-    # Reset to original state
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Cleanup after test
-    activities.clear()
-    activities.update(original_activities)
+
+from app import activities
+
+pytestmark = pytest.mark.asyncio
+
+
+# Query params for the canonical test students
+_MICHAEL = {"email": "michael@mergington.edu"}
+_NEWSTUDENT = {"email": "newstudent@mergington.edu"}
+_STUDENT = {"email": "student@mergington.edu"}
+_NOTREGISTERED = {"email": "notregistered@mergington.edu"}
+
+
+def _signup(client, activity, params):
+    """POST a signup request for the given activity and email params"""
+    return client.post(f"/activities/{quote(activity)}/signup", params=params)
+
+
+def _unregister(client, activity, params):
+    """POST an unregister request for the given activity and email params"""
+    return client.post(f"/activities/{quote(activity)}/unregister", params=params)
+
+
+_ENDPOINTS = {"signup": _signup, "unregister": _unregister}
 
 
 class TestGetActivities:
     """Test cases for GET /activities endpoint"""
 
-    def test_get_activities_success(self, client):
+    @pytest.mark.readonly
+    async def test_get_activities_success(self, client, seed_activities):
         """Test that we can retrieve all activities"""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         assert response.status_code == 200
-        data = response.json()
-        
-        # Verify we have all activities
-        assert "Chess Club" in data
-        assert "Programming Class" in data
-        assert "Gym Class" in data
-        
-        # Verify structure
-        assert "description" in data["Chess Club"]
-        assert "schedule" in data["Chess Club"]
-        assert "max_participants" in data["Chess Club"]
-        assert "participants" in data["Chess Club"]
+        assert response.json() == seed_activities
 
-    def test_get_activities_includes_participants(self, client):
+    @pytest.mark.readonly
+    async def test_get_activities_includes_participants(self, seed_activities_json):
         """Test that participants are included in the response"""
-        response = client.get("/activities")
-        data = response.json()
-        
+        data = seed_activities_json
+
         assert "michael@mergington.edu" in data["Chess Club"]["participants"]
         assert "daniel@mergington.edu" in data["Chess Club"]["participants"]
 
@@ -123,147 +53,110 @@ class TestGetActivities:
 class TestSignupForActivity:
     """Test cases for POST /activities/{activity_name}/signup endpoint"""
 
-    def test_signup_success(self, client):
+    async def test_signup_success(self, client):
         """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Chess%20Club/signup?email=newstudent@mergington.edu"
-        )
+        response = await _signup(client, "Chess Club", _NEWSTUDENT)
         assert response.status_code == 200
         data = response.json()
         assert "Signed up" in data["message"]
-        assert "newstudent@mergington.edu" in data["message"]
+        assert _NEWSTUDENT["email"] in data["message"]
         assert "Chess Club" in data["message"]
 
-    def test_signup_adds_participant(self, client):
+    async def test_signup_adds_participant(self, client):
         """Test that signup actually adds the participant"""
-        client.post(
-            "/activities/Chess%20Club/signup?email=newstudent@mergington.edu"
-        )
-        
+        await _signup(client, "Chess Club", _NEWSTUDENT)
+
         # Verify participant was added
-        response = client.get("/activities")
-        data = response.json()
-        assert "newstudent@mergington.edu" in data["Chess Club"]["participants"]
-
-    def test_signup_nonexistent_activity(self, client):
-        """Test signup for a non-existent activity"""
-        response = client.post(
-            "/activities/Fake%20Club/signup?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Activity not found"
-
-    def test_signup_duplicate_student(self, client):
-        """Test that a student cannot sign up twice for the same activity"""
-        response = client.post(
-            "/activities/Chess%20Club/signup?email=michael@mergington.edu"
-        )
-        assert response.status_code == 400
-        assert "already signed up" in response.json()["detail"]
+        assert _NEWSTUDENT["email"] in activities["Chess Club"]["participants"]
 
-    def test_signup_multiple_activities(self, client):
+    async def test_signup_multiple_activities(self, client):
         """Test that a student can sign up for multiple activities"""
-        email = "student@mergington.edu"
-        
         # Sign up for Chess Club
-        response1 = client.post(
-            f"/activities/Chess%20Club/signup?email={email}"
-        )
+        response1 = await _signup(client, "Chess Club", _STUDENT)
         assert response1.status_code == 200
         
         # Sign up for Programming Class
-        response2 = client.post(
-            f"/activities/Programming%20Class/signup?email={email}"
-        )
+        response2 = await _signup(client, "Programming Class", _STUDENT)
         assert response2.status_code == 200
         
         # Verify both signups worked
-        response = client.get("/activities")
-        data = response.json()
-        assert email in data["Chess Club"]["participants"]
-        assert email in data["Programming Class"]["participants"]
+        assert _STUDENT["email"] in activities["Chess Club"]["participants"]
+        assert _STUDENT["email"] in activities["Programming Class"]["participants"]
 
 
 class TestUnregisterFromActivity:
     """Test cases for POST /activities/{activity_name}/unregister endpoint"""
 
-    def test_unregister_success(self, client):
-        """Test successful unregistration from an activity"""
-        response = client.post(
-            "/activities/Chess%20Club/unregister?email=michael@mergington.edu"
-        )
+    async def test_unregister_success_and_removes_participant(self, client):
+        """Test successful unregistration removes the participant"""
+        response = await _unregister(client, "Chess Club", _MICHAEL)
         assert response.status_code == 200
         data = response.json()
         assert "Unregistered" in data["message"]
-        assert "michael@mergington.edu" in data["message"]
+        assert _MICHAEL["email"] in data["message"]
 
-    def test_unregister_removes_participant(self, client):
-        """Test that unregister actually removes the participant"""
-        client.post(
-            "/activities/Chess%20Club/unregister?email=michael@mergington.edu"
-        )
-        
         # Verify participant was removed
-        response = client.get("/activities")
-        data = response.json()
-        assert "michael@mergington.edu" not in data["Chess Club"]["participants"]
-
-    def test_unregister_nonexistent_activity(self, client):
-        """Test unregister from a non-existent activity"""
-        response = client.post(
-            "/activities/Fake%20Club/unregister?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Activity not found"
-
-    def test_unregister_not_registered_student(self, client):
-        """Test that we cannot unregister a student who is not registered"""
-        response = client.post(
-            "/activities/Chess%20Club/unregister?email=notregistered@mergington.edu"
-        )
-        assert response.status_code == 400
-        assert "not registered" in response.json()["detail"]
+        assert _MICHAEL["email"] not in activities["Chess Club"]["participants"]
 
-    def test_unregister_already_unregistered(self, client):
+    async def test_unregister_already_unregistered(self, client):
         """Test that we cannot unregister a student twice"""
         # First unregister
-        client.post(
-            "/activities/Chess%20Club/unregister?email=michael@mergington.edu"
-        )
-        
+        response = await _unregister(client, "Chess Club", _MICHAEL)
+        assert response.status_code == 200
+
         # Try to unregister again
-        response = client.post(
-            "/activities/Chess%20Club/unregister?email=michael@mergington.edu"
-        )
+        response = await _unregister(client, "Chess Club", _MICHAEL)
         assert response.status_code == 400
+        assert "not registered" in response.json()["detail"]
+
+
+class TestErrorResponses:
+    """Test cases for signup/unregister error responses"""
+
+    @pytest.mark.parametrize("endpoint,activity,params,status,detail_sub", [
+        ("signup", "Fake Club", _STUDENT, 404, "Activity not found"),
+        ("signup", "Chess Club", _MICHAEL, 400, "already signed up"),
+        ("unregister", "Fake Club", _STUDENT, 404, "Activity not found"),
+        ("unregister", "Chess Club", _NOTREGISTERED, 400, "not registered"),
+    ], ids=[
+        "signup-unknown-activity",
+        "signup-duplicate-student",
+        "unregister-unknown-activity",
+        "unregister-not-registered",
+    ])
+    async def test_error_paths(self, client, endpoint, activity, params, status, detail_sub):
+        """Test that invalid signup/unregister requests are rejected"""
+        response = await _ENDPOINTS[endpoint](client, activity, params)
+        assert response.status_code == status
+        assert detail_sub in response.json()["detail"]
 
 
 class TestRootRedirect:
     """Test cases for root endpoint"""
 
-    def test_root_redirect(self, client):
+    @pytest.mark.readonly
+    async def test_root_redirect(self, client):
         """Test that root path redirects to static/index.html"""
-        response = client.get("/", follow_redirects=False)
+        response = await client.get("/", follow_redirects=False)
         assert response.status_code == 307
-        assert "/static/index.html" in response.headers["location"]
+
+        location = response.headers["location"]
+        assert location == "/static/index.html"
 
 
 class TestActivityConstraints:
     """Test cases for activity constraints (max participants)"""
 
-    def test_signup_still_works_within_limit(self, client):
+    async def test_signup_still_works_within_limit(self, client):
         """Test that signup works when under max participants"""
-        email = "newstudent@mergington.edu"
-        response = client.post(
-            f"/activities/Gym%20Class/signup?email={email}"
-        )
+        response = await _signup(client, "Gym Class", _NEWSTUDENT)
         assert response.status_code == 200
 
-    def test_activity_has_max_participants(self, client):
+    @pytest.mark.readonly
+    async def test_activity_has_max_participants(self, seed_activities_json):
         """Test that activities have max_participants field"""
-        response = client.get("/activities")
-        data = response.json()
-        
+        data = seed_activities_json
+
         assert data["Chess Club"]["max_participants"] == 12
         assert data["Programming Class"]["max_participants"] == 20
         assert data["Gym Class"]["max_participants"] == 30